@@ -0,0 +1,249 @@
+# bench_replay.py
+# -*- coding: utf-8 -*-
+"""
+세션 재생 탐색 검증 + 시간 측정 (화면 불필요)
+
+2시간 분량의 합성 세션 로그(타이머 틱/Lap, 계산기, 메모장 부분 수정, 그림판 선분)를
+녹화기와 같은 방식(KEYFRAME_MS 간격 키프레임)으로 만든 뒤, SeekCursor로
+
+1. 임의 순서의 탐색 결과가 t=0부터 끝까지 순서대로 재생한 상태와 같은지
+2. 탐색 1회가 목표 시간(기본 20ms) 안에 끝나는지
+3. 저장/불러오기(JSON) 후에도 같은 결과가 나오는지
+4. 첫 키프레임이 t=0보다 늦은 로그(구버전 녹화)에서 그 이전 시점을 탐색해도
+   첫 키프레임 상태가 되는지 (끝 → 0 되감기 포함)
+
+를 확인한다. 위젯 대신 같은 이벤트를 받는 순수 파이썬 상태 모델을 쓰므로
+키프레임/인덱스 처리만 측정하며, 실제 위젯 갱신 비용은 포함되지 않는다.
+
+실행: python bench_replay.py [--seeks N] [--target-ms MS] [--seed S]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from gui.session_log import KEYFRAME_MS, SessionLog, SeekCursor
+
+DURATION_MS = 2 * 60 * 60 * 1000
+
+
+class StateModel:
+    """재생 창(ReplayWindow)의 restore/apply와 같은 이벤트를 받는 상태 모델"""
+    def __init__(self, log: SessionLog):
+        self.log = log
+        self.remaining = 0
+        self.splits: list[float] = []
+        self.calc = None
+        self.text = ""
+        self.mode = 0
+        self.canvas = (0, 0)  # (선분 수, 누적 해시) — 그림판 픽셀 대신
+
+    def snapshot(self, image: int) -> dict:
+        return {
+            "timer": {"remaining": self.remaining, "splits": list(self.splits)},
+            "calc": self.calc,
+            "mode": self.mode,
+            "text": self.text,
+            "canvas": image,
+        }
+
+    def canvas_bytes(self) -> bytes:
+        return f"{self.canvas[0]}:{self.canvas[1]}".encode()
+
+    def restore(self, state: dict):
+        self.remaining = state["timer"]["remaining"]
+        self.splits = list(state["timer"]["splits"])
+        self.calc = state["calc"]
+        self.mode = state["mode"]
+        self.text = state["text"]
+        n, h = self.log.images[state["canvas"]].decode().split(":")
+        self.canvas = (int(n), int(h))
+
+    def apply(self, kind: str, payload):
+        if kind == "timer":
+            sub, value = payload
+            if sub == "tick":
+                self.remaining = value
+            elif sub == "lap":
+                self.splits.append(value)
+            elif sub == "start":
+                self.remaining = value["remaining"]
+        elif kind == "calc":
+            self.calc = payload
+        elif kind == "note":
+            pos, removed, inserted = payload
+            self.text = self.text[:pos] + inserted + self.text[pos + removed:]
+        elif kind == "stroke":
+            n, h = self.canvas
+            self.canvas = (n + 1, (h * 1_000_003 + hash(tuple(payload))) & 0xFFFFFFFF)
+        elif kind == "canvas_clear":
+            self.canvas = (0, 0)
+        elif kind == "mode":
+            self.mode = payload
+
+    def fingerprint(self):
+        calc = None if self.calc is None else (tuple(self.calc["history"]), self.calc["input"])
+        return self.remaining, tuple(self.splits), calc, self.text, self.mode, self.canvas
+
+
+def _raw_events(rng: random.Random) -> list[tuple[int, str, object]]:
+    """스트림별 합성 이벤트 (시간순 정렬 전)"""
+    total = DURATION_MS // 1000
+    ev = [(0, "timer", ["start", {"remaining": total, "total": total, "input": "120:00", "new_block": True}])]
+    ev += [(s * 1000, "timer", ["tick", total - s]) for s in range(1, total + 1)]
+
+    t = 0
+    while True:  # 문항 경계: 40~150초 간격
+        sec = rng.uniform(40, 150)
+        t += int(sec * 1000)
+        if t >= DURATION_MS:
+            break
+        ev.append((t, "timer", ["lap", round(sec, 3)]))
+
+    t, history = 0, []
+    while (t := t + rng.randint(5_000, 40_000)) < DURATION_MS:  # 계산기
+        history = (history + [f"{rng.randint(1, 999)}*{rng.randint(1, 99)}"])[-3:]
+        ev.append((t, "calc", {"history": history, "input": "", "last": None}))
+
+    t, length = 0, 0
+    while (t := t + rng.randint(200, 3_000)) < DURATION_MS:  # 메모장 타이핑/삭제
+        if length and rng.random() < 0.15:
+            pos = rng.randrange(length)
+            removed = min(length - pos, rng.randint(1, 5))
+            ev.append((t, "note", [pos, removed, ""]))
+            length -= removed
+        else:
+            pos = length if rng.random() < 0.8 else rng.randint(0, length)
+            s = rng.choice(["a", "가", "1", "\n", "😀", "xy"])
+            ev.append((t, "note", [pos, 0, s]))
+            length += len(s)
+
+    t = 0
+    while (t := t + rng.randint(20_000, 60_000)) < DURATION_MS:  # 그림판: 60Hz 획 묶음
+        ev.append((t, "mode", 1))
+        x, y = rng.randint(0, 1200), rng.randint(0, 600)
+        for i in range(rng.randint(200, 900)):
+            nx, ny = x + rng.randint(-5, 5), y + rng.randint(-5, 5)
+            ev.append((t + i * 16, "stroke", [x, y, nx, ny]))
+            x, y = nx, ny
+        if rng.random() < 0.1:
+            ev.append((t + 15_000, "canvas_clear", None))
+        ev.append((t + 16_000, "mode", 0))
+    return ev
+
+
+def build_log(rng: random.Random, first_kf: int = 0) -> SessionLog:
+    """
+    녹화기와 같은 규칙(시작 시 + KEYFRAME_MS마다 키프레임, 변경 시에만 새 이미지)으로 로그 생성
+    first_kf > 0 이면 첫 키프레임을 그 시각에 찍고, 그 이전 이벤트는 첫 키프레임에 포함시킨다.
+    """
+    raw = sorted((e for e in _raw_events(rng) if e[0] <= DURATION_MS), key=lambda e: e[0])
+    log = SessionLog()
+    model = StateModel(log)
+    image, dirty = -1, True
+
+    def keyframe(t):
+        nonlocal image, dirty
+        if dirty:
+            image, dirty = log.add_image(model.canvas_bytes()), False
+        log.add_keyframe(t, model.snapshot(image))
+
+    early = [e for e in raw if e[0] < first_kf]
+    raw = raw[len(early):]
+    for t, kind, payload in early:
+        log.add_event(t, kind, payload)
+        model.apply(kind, payload)
+    keyframe(first_kf)
+    next_kf = first_kf + KEYFRAME_MS
+    for t, kind, payload in raw:
+        while t >= next_kf:
+            keyframe(next_kf)
+            next_kf += KEYFRAME_MS
+        log.add_event(t, kind, payload)
+        model.apply(kind, payload)
+        if kind in ("stroke", "canvas_clear"):
+            dirty = True
+    log.duration = DURATION_MS
+    return log
+
+
+def ground_truth(log: SessionLog, targets: list[int]) -> tuple[dict, float]:
+    """
+    첫 키프레임부터 순서대로 한 번 재생하며 각 목표 시점의 상태 기록 (+ 전체 재생 시간)
+    첫 키프레임보다 이른 시점의 기대 상태는 첫 키프레임 상태다.
+    """
+    model = StateModel(log)
+    model.restore(log.keyframes[0][2])
+    truth, i = {}, log.keyframes[0][1]
+    t0 = time.perf_counter()
+    for t in sorted(targets):
+        while i < len(log.events) and log.events[i][0] <= t:
+            model.apply(log.events[i][1], log.events[i][2])
+            i += 1
+        truth[t] = model.fingerprint()
+    return truth, (time.perf_counter() - t0) * 1000
+
+
+def check(log: SessionLog, targets: list[int], truth: dict, target_ms: float, label: str) -> bool:
+    model = StateModel(log)
+    cursor = SeekCursor(log, model.restore, model.apply)
+    times, bad = [], 0
+    for t in targets:
+        t0 = time.perf_counter()
+        cursor.seek(t)
+        times.append((time.perf_counter() - t0) * 1000)
+        if model.fingerprint() != truth[t]:
+            bad += 1
+    worst = max(times)
+    print(f"[{label}] seeks: {len(times)}, mismatches: {bad}, "
+          f"median {statistics.median(times):.3f} ms, max {worst:.3f} ms (target {target_ms} ms)")
+    return bad == 0 and worst <= target_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 재생 탐색 검증")
+    parser.add_argument("--seeks", type=int, default=500)
+    parser.add_argument("--target-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    log = build_log(rng)
+    print(f"events: {len(log.events)}, keyframes: {len(log.keyframes)}, "
+          f"images: {len(log.images)}, duration: {log.duration // 1000}s")
+
+    # 임의 점프(앞/뒤) + 재생처럼 조금씩 전진 + 양 끝
+    jumps = [rng.randint(0, log.duration) for _ in range(args.seeks)]
+    start = rng.randint(0, log.duration - 600_000)
+    playback = [start + i * 400 for i in range(1500)]  # 50ms 틱 × 8배속, 10분
+    targets = jumps + playback + [0, log.duration]
+
+    truth, full_ms = ground_truth(log, targets)
+    print(f"replay from t=0 to end (one pass): {full_ms:.1f} ms")
+
+    ok = check(log, targets, truth, args.target_ms, "memory")
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "session.json")
+        log.save(path)
+        size = os.path.getsize(path)
+        loaded = SessionLog.load(path)
+    print(f"session file: {size / 1e6:.2f} MB")
+    ok = check(loaded, targets, truth, args.target_ms, "loaded") and ok
+
+    # 첫 키프레임이 늦은 로그: 끝까지 갔다가 0으로 되감기 등
+    late = build_log(random.Random(args.seed), first_kf=20)
+    edge = [late.duration, 0, 10, 19, 20, 25, 5_000, 0, late.duration // 2, 3, 20_000]
+    edge += [rng.randint(0, late.duration) for _ in range(100)]
+    truth, _ = ground_truth(late, edge)
+    ok = check(late, edge, truth, args.target_ms, "first keyframe at 20ms") and ok
+
+    print("OK" if ok else "FAILED")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# bench_style.py
+# -*- coding: utf-8 -*-
+"""
+타이머 틱 1회당 스타일/polish 비용 측정 (실제 TimerWidget._render 구동)
+
+- before: 테마 도입 직전 커밋의 gui/timer.py (틱마다 setStyleSheet → 재파싱 + 재polish)
+- after : 현재 gui/timer.py (상태가 바뀔 때만 캐시된 QPalette로 교체)
+
+두 위젯 모두 카운트다운 중(_running=True) 상태에서 남은 시간을 1초씩 줄이며
+_render → ensurePolished → processEvents 까지를 한 틱으로 잰다.
+표시 글꼴은 양쪽 모두 18px Bold(Qt5는 CSS font-weight:600을 weight 75로 매핑)이며,
+측정 전에 확인해 출력한다.
+QtMultimedia를 불러올 수 없는 환경(libpulse 없음 등)에서는 비프음만 빈 QSoundEffect로
+대신한다. 측정 대상인 _render는 사운드를 쓰지 않는다.
+
+실행: python bench_style.py [틱 수] [--baseline REV]
+화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen 으로 실행된다.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtWidgets import QApplication
+
+ROOT = Path(__file__).resolve().parent
+
+
+def _ensure_multimedia():
+    """QtMultimedia 로드 실패 시 비프음 전용 빈 QSoundEffect 모듈을 끼워 넣는다."""
+    try:
+        import PyQt5.QtMultimedia  # noqa: F401
+    except ImportError:
+        class QSoundEffect(QObject):
+            def setSource(self, url): pass
+            def setVolume(self, v): pass
+            def setLoopCount(self, n): pass
+            def play(self): pass
+
+        stub = types.ModuleType("PyQt5.QtMultimedia")
+        stub.QSoundEffect = QSoundEffect
+        sys.modules["PyQt5.QtMultimedia"] = stub
+        print("note: QtMultimedia unavailable, using silent QSoundEffect stub")
+
+
+def _git(*args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=ROOT, text=True).strip()
+
+
+def baseline_rev() -> str:
+    """gui/theme.py를 처음 추가한 커밋의 부모 = 테마 도입 직전"""
+    added = _git("log", "-1", "--format=%H", "--diff-filter=A", "--", "gui/theme.py")
+    return f"{added}^"
+
+
+def load_baseline_timer(rev: str):
+    """지정 리비전의 gui/timer.py를 별도 모듈로 불러와 TimerWidget 클래스를 돌려준다."""
+    src = _git("show", f"{rev}:gui/timer.py")
+    mod = types.ModuleType("gui._timer_baseline")
+    mod.__file__ = str(ROOT / "gui" / "timer.py")  # resource_path 기준 경로 유지
+    exec(compile(src, f"{rev}:gui/timer.py", "exec"), mod.__dict__)
+    return mod.TimerWidget
+
+
+def run(widget, app: QApplication, ticks: int) -> float:
+    """틱당 평균 시간(ms): _render + polish + 이벤트 처리"""
+    widget.show()
+    widget._running = True
+    widget._remaining = ticks
+    widget._render()
+    app.processEvents()
+
+    label = widget.lbl_show
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        widget._remaining -= 1
+        widget._render()
+        label.ensurePolished()
+        app.processEvents()
+    elapsed = time.perf_counter() - t0
+
+    widget._running = False
+    widget.hide()
+    return elapsed * 1000 / ticks
+
+
+def describe_font(widget) -> str:
+    f = widget.lbl_show.font()
+    return f"{f.pixelSize()}px weight={f.weight()}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("ticks", nargs="?", type=int, default=1200)
+    parser.add_argument("--baseline", metavar="REV", help="비교 기준 리비전 (기본: 테마 도입 직전)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+
+    _ensure_multimedia()
+    from gui.timer import TimerWidget
+    from gui.theme import ThemeManager
+    BaselineTimer = load_baseline_timer(args.baseline or baseline_rev())
+
+    before_w = BaselineTimer()
+    after_w = TimerWidget(theme=ThemeManager())
+    # 첫 _render 이후의 실제 표시 글꼴 비교
+    before_w._render(); before_w.lbl_show.ensurePolished()
+    after_w._render(); after_w.lbl_show.ensurePolished()
+
+    before = run(before_w, app, args.ticks)
+    after = run(after_w, app, args.ticks)
+
+    print(f"ticks: {args.ticks}")
+    print(f"font  before: {describe_font(before_w)} / after: {describe_font(after_w)}")
+    print(f"before (setStyleSheet per tick): {before:.4f} ms/tick")
+    print(f"after  (cached QPalette swap)  : {after:.4f} ms/tick")
+    if after > 0:
+        print(f"speedup: x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,14 @@ from __future__ import annotations
 import ast
 from decimal import Decimal, getcontext, InvalidOperation
 
-from PyQt5.QtCore import Qt, QObject, QEvent
+from PyQt5.QtCore import Qt, QObject, QEvent, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget, QPushButton, QPlainTextEdit, QVBoxLayout, QLineEdit,
     QGridLayout, QSizePolicy, QFrame
 )
 
+from .theme import ThemeManager, io_card_css
+
 # 원하는 정밀도(표시 자리수 아님)
 getcontext().prec = 10
 
@@ -83,17 +85,20 @@ def safe_eval_expr(expr: str) -> Decimal:
 
 # -------- Calculator Widget --------
 class Calculator(QWidget):
-    def __init__(self, parent=None):
+    state_changed = pyqtSignal()  # 입력/결과/기록 변경 (세션 기록용)
+
+    def __init__(self, parent=None, theme: ThemeManager | None = None):
         super().__init__(parent)
         self._last_result: Decimal | None = None  # 직전 결과
         self._history = []  # 최근 3줄 저장
+        self._buttons: list[QPushButton] = []
 
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(2)
 
         # ====== IO 카드 컨테이너 ======
-        card = QFrame()
+        card = self.card = QFrame()
         card.setObjectName("ioCard")
 
         card_lay = QVBoxLayout(card)
@@ -136,6 +141,7 @@ class Calculator(QWidget):
             btn.setMinimumHeight(40)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             grid.addWidget(btn, r, c)
+            self._buttons.append(btn)
             if text == "C":
                 btn.clicked.connect(self._clear_all)
             elif text == "⌫":
@@ -152,52 +158,45 @@ class Calculator(QWidget):
         self.setLayout(layout)
         self.installEventFilter(self)  # click anywhere -> focus input
         self.input.returnPressed.connect(self._equals)
+        self.input.textChanged.connect(self.state_changed)
 
         # Styling
         for i in range(grid.rowCount()):
             grid.setRowMinimumHeight(i, 40)
 
-        self.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-            }
-
-            /* ✅ IO 카드: 흰색 네모 + 라운드 */
-            QFrame#ioCard {
-                background: #ffffff;
-                border: 1px solid #E5E7EB;
-                border-radius: 12px;
-            }
-
-            /* ✅ 내부 위젯은 투명 + 경계 없음 */
-            QFrame#ioCard QLineEdit,
-            QFrame#ioCard QPlainTextEdit {
-                border: none;
-                background: transparent;
-                padding: 6px 8px;
-                font-size: 16px;
-            }
-
-            QFrame#ioCard:focus-within {
-                border: 1px solid #3B82F6; /* 포커스시 파란 라인 */
-            }
-
-            QPlainTextEdit QScrollBar:vertical {
-                width: 8px;
-                background: transparent;
-            }
-            QPlainTextEdit QScrollBar::handle:vertical {
-                background: #E5E7EB;
-                border-radius: 4px;
-                min-height: 24px;
-            }
-        """)
+        # 키패드 버튼은 글꼴/팔레트만 지정하고, 스타일시트는 IO 카드에만 한정
+        self.apply_theme(theme or ThemeManager())
+
+    def apply_theme(self, theme: ThemeManager):
+        font = theme.font("button")
+        for btn in self._buttons:
+            btn.setFont(font)
+        self.output.setFont(theme.font("io"))
+        self.input.setFont(theme.font("io"))
+        self.card.setStyleSheet(io_card_css(theme.theme))
+
+    # -------- 세션 기록/재생 --------
+    def snapshot(self) -> dict:
+        return {
+            "history": list(self._history),
+            "input": self.input.text(),
+            "last": None if self._last_result is None else str(self._last_result),
+        }
+
+    def restore(self, state: dict):
+        self._history = list(state["history"])
+        self._last_result = None if state["last"] is None else D(state["last"])
+        self._render_history()
+        self.input.setText(state["input"])
 
     # -------- 헬퍼: 출력 3줄 유지 --------
     def _push_line(self, line: str):
         self._history.append(line)
         if len(self._history) > 3:
             self._history.pop(0)
+        self._render_history()
+
+    def _render_history(self):
         self.output.setPlainText("\n".join(self._history))
 
         # 오른쪽 정렬 유지
@@ -231,6 +230,7 @@ class Calculator(QWidget):
         self.output.clear()
         self._last_result = None
         self._history = []
+        self.state_changed.emit()
         self.input.setFocus()
 
     def _backspace(self):
@@ -259,6 +259,7 @@ class Calculator(QWidget):
 
         self._push_line(f"√({fmt(value)}) = {fmt(result)}")
         self._last_result = result
+        self.state_changed.emit()
         self.input.clear()
         self.input.setFocus()
 
@@ -274,6 +275,7 @@ class Calculator(QWidget):
 
         self._push_line(f"{expr} = {fmt(result)}")
         self._last_result = result
+        self.state_changed.emit()
         self.input.clear()
         self.input.setFocus()
 
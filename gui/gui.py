@@ -1,6 +1,8 @@
 # gui/gui.py
 # -*- coding: utf-8 -*-
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFrame
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFrame, QShortcut
+from .theme import ThemeManager, DEFAULT_THEME
 from .timer import TimerWidget
 from .notes_paint import TopArea
 from .calculator import Calculator
@@ -8,19 +10,20 @@ from .calculator import Calculator
 APP_TITLE = "Aptitude Tools (PyQt5) v1.0.2"
 
 class MainWindow(QWidget):
-    def __init__(self):
+    def __init__(self, theme: str = DEFAULT_THEME):
         super().__init__()
         self.setWindowTitle(APP_TITLE)
         self.resize(400, 800)
+        self.theme = ThemeManager(theme)
 
         main = QVBoxLayout(self)
         main.setContentsMargins(8, 8, 8, 8)
         main.setSpacing(8)
 
         # 순서: 타이머 → 메모장/그림판 → 계산기
-        self.timer = TimerWidget()
+        self.timer = TimerWidget(theme=self.theme)
         self.top_area = TopArea()
-        self.calc = Calculator()
+        self.calc = Calculator(theme=self.theme)
 
         # 구성
         main.addWidget(self.timer)  # 맨 위
@@ -31,4 +34,21 @@ class MainWindow(QWidget):
         line2 = QFrame(); line2.setFrameShape(QFrame.HLine); line2.setFrameShadow(QFrame.Sunken)
         main.addWidget(line2)
 
-        main.addWidget(self.calc, stretch=1)
\ No newline at end of file
+        main.addWidget(self.calc, stretch=1)
+
+        self.setPalette(self.theme.palette("window"))
+
+        # Ctrl+T: 테마 순환 (light → dark → high-contrast)
+        QShortcut(QKeySequence("Ctrl+T"), self, activated=self._cycle_theme)
+        # Ctrl+L: 어느 위젯에 포커스가 있든 문항 경계(Lap) 기록
+        self.sc_lap = QShortcut(QKeySequence("Ctrl+L"), self, activated=self.timer.lap)
+
+    # -------- 테마 --------
+    def set_theme(self, name: str):
+        self.theme.set_theme(name)
+        self.setPalette(self.theme.palette("window"))
+        self.timer.apply_theme(self.theme)
+        self.calc.apply_theme(self.theme)
+
+    def _cycle_theme(self):
+        self.set_theme(self.theme.next_name())
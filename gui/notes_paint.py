@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QPen, QPixmap
+from PyQt5.QtCore import Qt, QPoint, QBuffer, QByteArray, QIODevice, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QPixmap, QTextCursor
 from PyQt5.QtWidgets import (
     QWidget, QPushButton, QTextEdit, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QFrame, QSizePolicy
@@ -10,6 +10,9 @@ from PyQt5.QtWidgets import (
 
 # -------- Paint Canvas --------
 class PaintCanvas(QWidget):
+    segment_drawn = pyqtSignal(QPoint, QPoint)  # 선분 하나 (세션 기록용)
+    cleared = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._pix = QPixmap(1200, 600)
@@ -20,6 +23,34 @@ class PaintCanvas(QWidget):
     def clear(self):
         self._pix.fill(Qt.white)
         self.update()
+        self.cleared.emit()
+
+    def draw_segment(self, p1: QPoint, p2: QPoint):
+        painter = QPainter(self._pix)
+        painter.setPen(self._pen)
+        painter.drawLine(p1, p2)
+        painter.end()
+        self.update()
+        self.segment_drawn.emit(p1, p2)
+
+    def to_png(self) -> bytes:
+        buf = QBuffer()
+        buf.open(QIODevice.WriteOnly)
+        self._pix.save(buf, "PNG")
+        return bytes(buf.data())
+
+    def load_png(self, data: bytes):
+        img = QPixmap()
+        img.loadFromData(QByteArray(data), "PNG")
+        w = max(img.width(), self._pix.width())
+        h = max(img.height(), self._pix.height())
+        if (w, h) != (self._pix.width(), self._pix.height()):
+            self._pix = QPixmap(w, h)
+        self._pix.fill(Qt.white)
+        qp = QPainter(self._pix)
+        qp.drawPixmap(0, 0, img)
+        qp.end()
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -43,12 +74,8 @@ class PaintCanvas(QWidget):
 
     def mouseMoveEvent(self, event):
         if (event.buttons() & Qt.LeftButton) and self._last_pos is not None:
-            painter = QPainter(self._pix)
-            painter.setPen(self._pen)
-            painter.drawLine(self._last_pos, event.pos())
-            painter.end()
+            self.draw_segment(self._last_pos, event.pos())
             self._last_pos = event.pos()
-            self.update()
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -56,6 +83,8 @@ class PaintCanvas(QWidget):
 
 # -------- Top Area (Notepad/Paint) --------
 class TopArea(QWidget):
+    mode_changed = pyqtSignal(int)  # 0: 메모장, 1: 그림판
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -107,6 +136,31 @@ class TopArea(QWidget):
         self.btn_note.clicked.connect(self._switch_note)
         self.btn_paint.clicked.connect(self._switch_paint)
         self.btn_clear.clicked.connect(self._clear_active)
+        self.stack.currentChanged.connect(self.mode_changed)
+
+    # -------- 세션 기록/재생 --------
+    def set_mode(self, index: int):
+        if index == 0:
+            self._switch_note()
+        else:
+            self._switch_paint()
+
+    # 위치/길이는 QTextDocument 단위(UTF-16, 문단 구분 1칸) — contentsChange와 동일
+    # setPlainText 등 전체 교체 시 보고되는 길이에는 문서 끝 문단 구분자가 포함될 수 있어 잘라낸다.
+    def _select(self, pos: int, n: int) -> QTextCursor:
+        doc = self.text.document()
+        last = doc.characterCount() - 1
+        cur = QTextCursor(doc)
+        cur.setPosition(min(pos, last))
+        cur.setPosition(min(pos + n, last), QTextCursor.KeepAnchor)
+        return cur
+
+    def text_slice(self, pos: int, n: int) -> str:
+        return self._select(pos, n).selectedText().replace("\u2029", "\n")
+
+    def apply_text_edit(self, pos: int, removed: int, inserted: str):
+        """메모장 부분 수정: pos부터 removed 칸을 inserted로 교체"""
+        self._select(pos, removed).insertText(inserted)
 
     def _switch_note(self):
         self.btn_note.setChecked(True)
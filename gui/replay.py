@@ -0,0 +1,201 @@
+# gui/replay.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from PyQt5.QtCore import QObject, QTimer, QElapsedTimer, QPoint, Qt
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider, QLabel, QComboBox
+)
+
+from .gui import MainWindow
+from .session_log import KEYFRAME_MS, SessionLog, SeekCursor
+from .timer import _fmt
+
+
+# -------- Recorder --------
+class SessionRecorder(QObject):
+    """MainWindow의 위젯 시그널을 받아 SessionLog에 기록하고, 주기적으로 키프레임을 찍는다."""
+    def __init__(self, window: MainWindow, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.log = SessionLog()
+        self._clock = QElapsedTimer()
+        self._image = -1            # 마지막 키프레임의 그림판 이미지 번호
+        self._canvas_dirty = True
+
+        self._kf_timer = QTimer(self)
+        self._kf_timer.setInterval(KEYFRAME_MS)
+        self._kf_timer.timeout.connect(self._keyframe)
+
+    def start(self):
+        w = self.window
+        self._clock.start()
+        self._keyframe(0)  # 시작 상태는 정확히 t=0
+
+        # 타이머는 변한 값만, 전체 구간 배열은 키프레임에만 기록
+        w.timer.timer_event.connect(lambda kind, value: self._add("timer", [kind, value]))
+        w.calc.state_changed.connect(lambda: self._add("calc", w.calc.snapshot()))
+        w.top_area.text.document().contentsChange.connect(self._on_text)
+        w.top_area.mode_changed.connect(lambda i: self._add("mode", i))
+        w.top_area.canvas.segment_drawn.connect(self._on_segment)
+        w.top_area.canvas.cleared.connect(self._on_canvas_clear)
+        self._kf_timer.start()
+
+    def save(self, path: str):
+        self._kf_timer.stop()
+        self.log.duration = max(self.log.duration, self._now())  # 마지막 이벤트 이후 유휴 시간 포함
+        self.log.save(path)
+
+    def _now(self) -> int:
+        return self._clock.elapsed()
+
+    def _add(self, kind: str, payload=None):
+        self.log.add_event(self._now(), kind, payload)
+
+    def _keyframe(self, t: int | None = None):
+        w = self.window
+        if t is None:
+            t = self._now()  # PNG 인코딩 전에 시각을 잡는다
+        if self._canvas_dirty:
+            self._image = self.log.add_image(w.top_area.canvas.to_png())
+            self._canvas_dirty = False
+        self.log.add_keyframe(t, {
+            "timer": w.timer.snapshot(),
+            "calc": w.calc.snapshot(),
+            "mode": w.top_area.stack.currentIndex(),
+            "text": w.top_area.text.toPlainText(),
+            "canvas": self._image,
+        })
+
+    def _on_text(self, pos: int, removed: int, added: int):
+        # 위치/길이는 문서 단위 그대로 기록 → 재생 시 QTextCursor로 같은 단위로 적용
+        inserted = self.window.top_area.text_slice(pos, added) if added else ""
+        self._add("note", [pos, removed, inserted])
+
+    def _on_segment(self, p1: QPoint, p2: QPoint):
+        self._canvas_dirty = True
+        self._add("stroke", [p1.x(), p1.y(), p2.x(), p2.y()])
+
+    def _on_canvas_clear(self):
+        self._canvas_dirty = True
+        self._add("canvas_clear")
+
+
+# -------- Player --------
+class ReplayWindow(QWidget):
+    """
+    기록된 세션을 같은 MainWindow 레이아웃 안에서 재생
+    - 탐색: SeekCursor (뒤로/멀리 가면 직전 키프레임 복원, 아니면 이어서 이벤트만 적용)
+    - 재생: 실제 경과 시간 × 배속만큼 위치를 옮기며 탐색
+    """
+    TICK_MS = 50
+
+    def __init__(self, log: SessionLog, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self.cursor = SeekCursor(log, self._restore, self._apply)
+        self._image = -1     # 그림판에 올라가 있는 이미지 번호
+        self._speed = 1.0
+
+        self.view = MainWindow()
+        self.view.setWindowTitle(self.view.windowTitle() + " — Replay")
+        self.setWindowTitle(self.view.windowTitle())
+        self.resize(self.view.size())
+        self.setPalette(self.view.theme.palette("window"))
+        self._make_read_only()
+
+        # --- 재생 컨트롤 ---
+        self.btn_play = QPushButton("Play")
+        self.btn_play.setFixedWidth(70)
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, log.duration)
+        self.lbl_pos = QLabel()
+        self.cmb_speed = QComboBox()
+        self.cmb_speed.addItems(["1x", "2x", "4x", "8x"])
+
+        bar = QHBoxLayout()
+        bar.setContentsMargins(8, 0, 8, 8)
+        bar.setSpacing(8)
+        bar.addWidget(self.btn_play)
+        bar.addWidget(self.slider, stretch=1)
+        bar.addWidget(self.lbl_pos)
+        bar.addWidget(self.cmb_speed)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.view, stretch=1)
+        layout.addLayout(bar)
+
+        self._clock = QElapsedTimer()
+        self._play_timer = QTimer(self)
+        self._play_timer.setInterval(self.TICK_MS)
+        self._play_timer.timeout.connect(self._advance)
+
+        self.btn_play.clicked.connect(self.toggle)
+        self.slider.valueChanged.connect(self.seek)
+        self.cmb_speed.currentTextChanged.connect(lambda s: setattr(self, "_speed", float(s[:-1])))
+
+        self.seek(0)
+
+    def _make_read_only(self):
+        # 재생 화면은 보기 전용: 마우스/키보드 입력 차단
+        v = self.view
+        for w in (v.timer, v.top_area, v.calc):
+            w.setAttribute(Qt.WA_TransparentForMouseEvents)
+            for child in [w] + w.findChildren(QWidget):
+                child.setFocusPolicy(Qt.NoFocus)
+        v.top_area.text.setReadOnly(True)
+        v.sc_lap.setEnabled(False)
+
+    # --- 재생 ---
+    def toggle(self):
+        if self._play_timer.isActive():
+            self._play_timer.stop()
+            self.btn_play.setText("Play")
+            return
+        if self.cursor.pos >= self.log.duration:
+            self.seek(0)
+        self._clock.start()
+        self._play_timer.start()
+        self.btn_play.setText("Pause")
+
+    def _advance(self):
+        step = int(self._clock.restart() * self._speed)
+        t = min(self.cursor.pos + step, self.log.duration)
+        self.slider.setValue(t)  # → seek
+        if t >= self.log.duration:
+            self.toggle()
+
+    # --- 탐색 ---
+    def seek(self, t: int):
+        if self.cursor.seek(t):
+            self.lbl_pos.setText(f"{_fmt(t // 1000)} / {_fmt(self.log.duration // 1000)}")
+
+    def _restore(self, state: dict):
+        v = self.view
+        v.timer.restore(state["timer"])
+        v.calc.restore(state["calc"])
+        v.top_area.set_mode(state["mode"])
+        if v.top_area.text.toPlainText() != state["text"]:
+            v.top_area.text.setPlainText(state["text"])
+        if state["canvas"] != self._image:
+            v.top_area.canvas.load_png(self.log.images[state["canvas"]])
+            self._image = state["canvas"]
+
+    def _apply(self, kind: str, payload):
+        top = self.view.top_area
+        if kind == "timer":
+            self.view.timer.apply_event(*payload)
+        elif kind == "calc":
+            self.view.calc.restore(payload)
+        elif kind == "note":
+            top.apply_text_edit(*payload)
+        elif kind == "stroke":
+            x1, y1, x2, y2 = payload
+            top.canvas.draw_segment(QPoint(x1, y1), QPoint(x2, y2))
+            self._image = -1  # 그림판이 키프레임 이미지와 달라짐
+        elif kind == "canvas_clear":
+            top.canvas.clear()
+            self._image = -1
+        elif kind == "mode":
+            top.set_mode(payload)
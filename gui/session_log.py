@@ -0,0 +1,120 @@
+# gui/session_log.py
+# -*- coding: utf-8 -*-
+"""세션 이벤트 로그와 키프레임 기반 탐색 (Qt 비의존)"""
+from __future__ import annotations
+
+import base64
+import json
+from array import array
+from bisect import bisect_right
+from typing import Callable
+
+KEYFRAME_MS = 10_000  # 키프레임 간격: 탐색 시 최대 10초 분량의 이벤트만 재적용
+LOG_VERSION = 2
+
+
+class SessionLog:
+    """
+    타임스탬프 이벤트 로그 + 키프레임 인덱스
+    - events: (t_ms, kind, payload) — 기록 순서 = 시간 순서
+    - times: 이벤트 시각 배열 (정렬됨, bisect용)
+    - keyframes: (t_ms, 이벤트 인덱스, 전체 상태 스냅샷)
+    - images: 그림판 PNG (변경이 없으면 키프레임끼리 같은 이미지를 공유)
+
+    이벤트 종류
+    - timer: [종류, 값] — start/pause/reset/tick/lap/questions (TimerWidget.timer_event)
+    - calc: 계산기 상태 스냅샷 (최근 3줄 + 입력, 작아서 통째로 기록)
+    - note: [pos, removed, inserted] 메모장 부분 수정 (QTextDocument 위치 단위)
+    - stroke: [x1, y1, x2, y2] 그림판 선분
+    - canvas_clear, mode: 그림판 지우기 / 메모장↔그림판 전환
+    """
+    def __init__(self):
+        self.events: list[tuple[int, str, object]] = []
+        self.times = array("q")
+        self.keyframes: list[tuple[int, int, dict]] = []
+        self.kf_times = array("q")
+        self.images: list[bytes] = []
+        self.duration = 0
+
+    def add_event(self, t: int, kind: str, payload=None):
+        self.events.append((t, kind, payload))
+        self.times.append(t)
+        self.duration = max(self.duration, t)
+
+    def add_keyframe(self, t: int, state: dict):
+        self.keyframes.append((t, len(self.events), state))
+        self.kf_times.append(t)
+        self.duration = max(self.duration, t)
+
+    def add_image(self, data: bytes) -> int:
+        self.images.append(data)
+        return len(self.images) - 1
+
+    def locate(self, t: int) -> tuple[int, int]:
+        """t 시점 기준 (직전 키프레임 번호, t 이하 이벤트 개수) — 둘 다 O(log n)"""
+        return bisect_right(self.kf_times, t) - 1, bisect_right(self.times, t)
+
+    # --- 저장/불러오기 ---
+    def save(self, path: str):
+        data = {
+            "version": LOG_VERSION,
+            "duration": self.duration,
+            "events": [list(ev) for ev in self.events],
+            "keyframes": [list(kf) for kf in self.keyframes],
+            "images": [base64.b64encode(img).decode("ascii") for img in self.images],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> SessionLog:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != LOG_VERSION:
+            raise ValueError(f"지원하지 않는 세션 파일 버전: {data.get('version')}")
+        log = cls()
+        for t, kind, payload in data["events"]:
+            log.events.append((t, kind, payload))
+            log.times.append(t)
+        for t, index, state in data["keyframes"]:
+            log.keyframes.append((t, index, state))
+            log.kf_times.append(t)
+        log.images = [base64.b64decode(s) for s in data["images"]]
+        log.duration = data["duration"]
+        return log
+
+
+class SeekCursor:
+    """
+    로그 위의 재생 위치
+    - 앞으로 가면서 다음 키프레임까지만 넘어가면: 이어서 이벤트만 적용 (키프레임 복원 없음)
+    - 뒤로 가거나 키프레임을 건너뛰면: 직전 키프레임 복원 후 그 이후 이벤트만 적용
+    - 첫 키프레임보다 이른 시점은 첫 키프레임 상태로 본다.
+    restore(state) / apply(kind, payload)는 실제 상태를 가진 쪽(재생 창 등)이 제공한다.
+    """
+    def __init__(self, log: SessionLog,
+                 restore: Callable[[dict], None],
+                 apply: Callable[[str, object], None]):
+        self.log = log
+        self._restore = restore
+        self._apply = apply
+        self.pos = 0        # 현재 위치(ms)
+        self.index = 0      # 적용된 이벤트 개수
+        self.kf = -1        # 현재 위치의 키프레임 번호 (-1: 아직 복원 전)
+
+    def seek(self, t: int) -> bool:
+        log = self.log
+        if not log.keyframes:
+            return False
+        k, end = log.locate(t)
+        k = max(k, 0)
+        if self.kf < 0 or t < self.pos or k > self.kf + 1:
+            _, index, state = log.keyframes[k]
+            self._restore(state)
+            self.index = index
+        for _, kind, payload in log.events[self.index:end]:
+            self._apply(kind, payload)
+        self.index = max(self.index, end)
+        self.pos = t
+        self.kf = k
+        return True
@@ -0,0 +1,104 @@
+# gui/splits.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import csv
+import heapq
+import os
+from array import array
+
+
+CSV_HEADER = ["session", "candidate", "question", "split_sec", "cumulative_sec"]
+
+
+class SplitStats:
+    """
+    문항별 구간(split) 기록 + 누적 통계
+    - 구간은 array('d')(초 단위)에 저장
+    - 평균: 누적 합으로 O(1)
+    - 중앙값: 두 힙(하위 절반 max-heap / 상위 절반 min-heap)으로 추가 O(log n), 조회 O(1)
+    - 예상 종료/페이스: 현재 경과 시간과 평균만 사용하므로 O(1)
+    """
+    def __init__(self, questions: int = 0, budget: float = 0.0):
+        self.questions = questions  # 전체 문항 수 (0이면 페이스 계산 안 함)
+        self.budget = budget        # 제한 시간(초)
+        self.reset()
+
+    def reset(self):
+        self.splits = array("d")
+        self._sum = 0.0
+        self._lo: list[float] = []  # 하위 절반 (부호 반전해 max-heap으로 사용)
+        self._hi: list[float] = []  # 상위 절반
+
+    # --- 기록 ---
+    def add(self, sec: float):
+        self.splits.append(sec)
+        self._sum += sec
+        if self._lo and sec > -self._lo[0]:
+            heapq.heappush(self._hi, sec)
+        else:
+            heapq.heappush(self._lo, -sec)
+        # 균형 유지: len(lo) == len(hi) 또는 len(hi) + 1
+        if len(self._lo) > len(self._hi) + 1:
+            heapq.heappush(self._hi, -heapq.heappop(self._lo))
+        elif len(self._hi) > len(self._lo):
+            heapq.heappush(self._lo, -heapq.heappop(self._hi))
+
+    # --- 통계 ---
+    @property
+    def count(self) -> int:
+        return len(self.splits)
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    def mean(self) -> float | None:
+        return self._sum / len(self.splits) if self.splits else None
+
+    def median(self) -> float | None:
+        if not self.splits:
+            return None
+        if len(self._lo) > len(self._hi):
+            return -self._lo[0]
+        return (-self._lo[0] + self._hi[0]) / 2
+
+    def projected_finish(self, elapsed: float) -> float | None:
+        """현재 평균 속도로 남은 문항을 풀었을 때의 총 소요 시간(초)"""
+        mean = self.mean()
+        if mean is None or self.questions <= 0:
+            return None
+        return elapsed + mean * max(0, self.questions - self.count)
+
+    def behind_pace(self, elapsed: float) -> int:
+        """목표 페이스(제한 시간 / 문항 수) 대비 뒤처진 문항 수 (앞서면 0)"""
+        if self.questions <= 0 or self.budget <= 0:
+            return 0
+        expected = int(elapsed * self.questions / self.budget)
+        return max(0, min(expected, self.questions) - self.count)
+
+    # --- 내보내기 ---
+    def export_csv(self, path: str, session: str, candidate: str = ""):
+        """
+        세션 구간을 long 형식 CSV에 기록한다. (여러 세션/응시자를 한 파일에 모아 비교)
+        - 열: session, candidate, question, split_sec, cumulative_sec
+        - 같은 session의 기존 행은 지우고 다시 쓰므로 여러 번 내보내도 중복되지 않는다.
+        """
+        kept = []
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                rows = csv.reader(f)
+                if next(rows, None) != CSV_HEADER:
+                    raise ValueError(f"열 구성이 다른 CSV 파일입니다: {path}")
+                kept = [row for row in rows if row and row[0] != session]
+
+        tmp = path + ".tmp"
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(CSV_HEADER)
+            w.writerows(kept)
+            cum = 0.0
+            for i, sec in enumerate(self.splits, 1):
+                cum += sec
+                w.writerow([session, candidate, i, f"{sec:.3f}", f"{cum:.3f}"])
+        os.replace(tmp, path)
@@ -0,0 +1,163 @@
+# gui/theme.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from PyQt5.QtGui import QColor, QFont, QPalette
+
+
+@dataclass(frozen=True)
+class Theme:
+    """테마 색상/글꼴 정의 (팔레트는 ThemeManager에서 미리 만들어 둔다)"""
+    name: str
+    window: str
+    base: str
+    text: str
+    button: str
+    button_text: str
+    highlight: str
+    border: str
+    accent: str     # IO 카드 포커스 등 강조색
+    warning: str    # 마지막 10초 경고색
+    error_bg: str   # 입력 형식 오류 배경
+    muted: str      # placeholder 등 보조 글자
+    font_scale: float = 1.0
+
+
+THEMES = {
+    "light": Theme(
+        name="light",
+        window="#F3F4F6", base="#FFFFFF", text="#222222",
+        button="#F9FAFB", button_text="#222222", highlight="#3B82F6",
+        border="#E5E7EB", accent="#3B82F6", warning="#D9534F",
+        error_bg="#FDECEA", muted="#9CA3AF",
+    ),
+    "dark": Theme(
+        name="dark",
+        window="#1F2126", base="#2A2D34", text="#E5E7EB",
+        button="#33363E", button_text="#E5E7EB", highlight="#60A5FA",
+        border="#3F434C", accent="#60A5FA", warning="#F87171",
+        error_bg="#4C2326", muted="#6B7280",
+    ),
+    "high-contrast": Theme(
+        name="high-contrast",
+        window="#000000", base="#000000", text="#FFFFFF",
+        button="#000000", button_text="#FFFF00", highlight="#00FFFF",
+        border="#FFFFFF", accent="#00FFFF", warning="#FF4040",
+        error_bg="#800000", muted="#C0C0C0", font_scale=1.2,
+    ),
+}
+
+DEFAULT_THEME = "light"
+
+
+def _palette(t: Theme, text: str | None = None, base: str | None = None) -> QPalette:
+    pal = QPalette()
+    fg = QColor(text or t.text)
+    pal.setColor(QPalette.Window, QColor(t.window))
+    pal.setColor(QPalette.WindowText, fg)
+    pal.setColor(QPalette.Base, QColor(base or t.base))
+    pal.setColor(QPalette.AlternateBase, QColor(t.window))
+    pal.setColor(QPalette.Text, fg)
+    pal.setColor(QPalette.PlaceholderText, QColor(t.muted))
+    pal.setColor(QPalette.Button, QColor(t.button))
+    pal.setColor(QPalette.ButtonText, QColor(t.button_text))
+    pal.setColor(QPalette.Highlight, QColor(t.highlight))
+    pal.setColor(QPalette.HighlightedText, QColor(t.base))
+    pal.setColor(QPalette.ToolTipBase, QColor(t.base))
+    pal.setColor(QPalette.ToolTipText, fg)
+    pal.setColor(QPalette.Mid, QColor(t.border))
+    pal.setColor(QPalette.Dark, QColor(t.border))
+    # 비활성 상태는 글자만 흐리게
+    dim = QColor(fg)
+    dim.setAlpha(120)
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        pal.setColor(QPalette.Disabled, role, dim)
+    return pal
+
+
+def _font(px: int, scale: float, bold: bool = False) -> QFont:
+    f = QFont()
+    f.setPixelSize(round(px * scale))
+    if bold:
+        f.setWeight(QFont.Bold)  # Qt5는 CSS font-weight:600을 Bold(75)로 매핑 — 기존 모양 유지
+    return f
+
+
+class ThemeManager:
+    """
+    팔레트/글꼴 캐시
+    - 테마를 고를 때 한 번만 QPalette/QFont를 만들고, 이후 상태 변화(경고, 오류 등)는
+      캐시된 객체를 setPalette로 바꿔 끼우기만 한다. (스타일시트 재파싱/재polish 없음)
+    - 팔레트 키: window, timer, timer_warning, input_error
+    - 글꼴 키: title, display, button, io
+    """
+    def __init__(self, name: str = DEFAULT_THEME):
+        self._palettes: dict[str, QPalette] = {}
+        self._fonts: dict[str, QFont] = {}
+        self.theme = THEMES[DEFAULT_THEME]
+        self.set_theme(name)
+
+    @staticmethod
+    def names() -> list[str]:
+        return list(THEMES)
+
+    def set_theme(self, name: str) -> None:
+        if name not in THEMES:
+            raise ValueError(f"알 수 없는 테마: {name}")
+        t = self.theme = THEMES[name]
+        self._palettes = {
+            "window": _palette(t),
+            "timer": _palette(t),
+            "timer_warning": _palette(t, text=t.warning),
+            "input_error": _palette(t, base=t.error_bg),
+        }
+        s = t.font_scale
+        self._fonts = {
+            "title": _font(14, s, bold=True),
+            "display": _font(18, s, bold=True),
+            "button": _font(14, s),
+            "io": _font(16, s),
+        }
+
+    def next_name(self) -> str:
+        names = self.names()
+        return names[(names.index(self.theme.name) + 1) % len(names)]
+
+    def palette(self, key: str) -> QPalette:
+        return self._palettes[key]
+
+    def font(self, key: str) -> QFont:
+        return self._fonts[key]
+
+
+def io_card_css(t: Theme) -> str:
+    """
+    계산기 IO 카드 전용 스타일시트 (라운드 테두리는 팔레트로 표현할 수 없음)
+    - 카드 위젯에만 설치하므로 키패드 버튼에는 전파되지 않는다.
+    - 테마를 바꿀 때만 다시 만든다.
+    """
+    return f"""
+        QFrame#ioCard {{
+            background: {t.base};
+            border: 1px solid {t.border};
+            border-radius: 12px;
+        }}
+        QFrame#ioCard QLineEdit,
+        QFrame#ioCard QPlainTextEdit {{
+            border: none;
+            background: transparent;
+            color: {t.text};
+            padding: 6px 8px;
+        }}
+        QFrame#ioCard QScrollBar:vertical {{
+            width: 8px;
+            background: transparent;
+        }}
+        QFrame#ioCard QScrollBar::handle:vertical {{
+            background: {t.border};
+            border-radius: 4px;
+            min-height: 24px;
+        }}
+    """
@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 import sys, os
+from datetime import datetime
 from pathlib import Path
 
 import re
 MMSS_RE = re.compile(r"^\s*(\d{1,3})(?::([0-5]?\d))?\s*$")
 
-from PyQt5.QtCore import QTimer, Qt, QUrl
+from PyQt5.QtCore import QTimer, Qt, QUrl, QElapsedTimer, pyqtSignal
+from PyQt5.QtGui import QPalette, QIntValidator
 from PyQt5.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, QPushButton
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, QPushButton, QFileDialog,
+    QInputDialog, QMessageBox
 )
 
 from PyQt5.QtMultimedia import QSoundEffect
 
+from .splits import SplitStats
+from .theme import ThemeManager
+
 def _fmt(sec: int) -> str:
     sec = max(0, sec)
     m, s = divmod(sec, 60)
@@ -42,17 +48,34 @@ class TimerWidget(QWidget):
     심플 카운트다운 타이머
     - 시간 입력: MM:SS 또는 숫자(초)
     - Start / Pause / Reset 버튼
-    - 단축키: Space(시작/일시정지), R(리셋)
+    - Lap: 문항 경계 기록 → 평균/중앙값/예상 종료/페이스 표시, CSV 내보내기
+    - 단축키: Space(시작/일시정지), R(리셋), L·Enter(Lap)
     """
-    def __init__(self, parent=None):
+    # 세션 기록용 이벤트 (종류, 값) — 틱마다 전체 상태 대신 변한 값만 보낸다
+    # start {remaining,total,input,new_block} / pause remaining / reset {remaining,input}
+    # tick remaining / lap 구간(초) / questions 문항 수 입력
+    timer_event = pyqtSignal(str, object)
+
+    def __init__(self, parent=None, theme: ThemeManager | None = None):
         super().__init__(parent)
         self._remaining = 0
         self._running = False
+        self._warn = False          # 마지막 10초 경고 상태 (팔레트 교체 여부 판단용)
+        self._edit_error = False    # 시간 입력 형식 오류 상태
+        self._theme = theme or ThemeManager()
+
+        # 구간 기록: 일시정지 시간을 뺀 실제 진행 시간 기준
+        self._total = 0             # 블록 제한 시간(초)
+        self._active_ms = 0         # 일시정지 전까지 누적된 진행 시간
+        self._lap_ms = 0            # 마지막 Lap 시점의 진행 시간
+        self._clock = QElapsedTimer()
+        self._session = ""          # 내보내기용 세션 ID (첫 시작 시 부여)
+        self._candidate = ""        # 내보내기용 응시자/라벨 (마지막 입력값 유지)
+        self.splits = SplitStats()
 
         # 제목
         self.lbl_title = QLabel("⏱ Timer")
         self.lbl_title.setAlignment(Qt.AlignCenter)
-        self.lbl_title.setStyleSheet("font-weight:600; font-size:14px;")
 
         # 시간 입력 및 표시
         self.edit = QLineEdit("20:00")
@@ -63,16 +86,27 @@ class TimerWidget(QWidget):
         self.lbl_show = QLabel("20:00")
         self.lbl_show.setFixedWidth(90)
         self.lbl_show.setAlignment(Qt.AlignCenter)
-        self.lbl_show.setStyleSheet("font-size:18px; font-weight:600;")
 
         # 버튼
         self.btn_start = QPushButton("Start")
         self.btn_pause = QPushButton("Pause")
         self.btn_reset = QPushButton("Reset")
+        self.btn_lap = QPushButton("Lap")
 
-        for btn in (self.btn_start, self.btn_pause, self.btn_reset):
+        for btn in (self.btn_start, self.btn_pause, self.btn_reset, self.btn_lap):
             btn.setFixedWidth(70)
 
+        # 문항 수 + 내보내기
+        self.edit_q = QLineEdit("20")
+        self.edit_q.setFixedWidth(50)
+        self.edit_q.setAlignment(Qt.AlignCenter)
+        self.edit_q.setValidator(QIntValidator(0, 999, self))
+        self.btn_export = QPushButton("Export")
+        self.btn_export.setFixedWidth(70)
+
+        self.lbl_stats = QLabel("")
+        self.lbl_stats.setAlignment(Qt.AlignCenter)
+
         # --- 상단 (입력 + 남은 시간) ---
         input_row = QHBoxLayout()
         input_row.setSpacing(10)
@@ -90,6 +124,16 @@ class TimerWidget(QWidget):
         btn_row.addWidget(self.btn_start)
         btn_row.addWidget(self.btn_pause)
         btn_row.addWidget(self.btn_reset)
+        btn_row.addWidget(self.btn_lap)
+
+        # --- 구간 (문항 수 + 통계) ---
+        split_row = QHBoxLayout()
+        split_row.setSpacing(10)
+        split_row.setAlignment(Qt.AlignCenter)
+        split_row.addWidget(QLabel("문항:"))
+        split_row.addWidget(self.edit_q)
+        split_row.addWidget(self.lbl_stats, stretch=1)
+        split_row.addWidget(self.btn_export)
 
         # --- 전체 구성 ---
         layout = QVBoxLayout(self)
@@ -98,6 +142,7 @@ class TimerWidget(QWidget):
         layout.addWidget(self.lbl_title)
         layout.addLayout(input_row)
         layout.addLayout(btn_row)
+        layout.addLayout(split_row)
 
         # 타이머 설정
         self.timer = QTimer(self)
@@ -108,6 +153,10 @@ class TimerWidget(QWidget):
         self.btn_start.clicked.connect(self.start)
         self.btn_pause.clicked.connect(self.pause)
         self.btn_reset.clicked.connect(self.reset)
+        self.btn_lap.clicked.connect(self.lap)
+        self.btn_export.clicked.connect(self.export_splits)
+        self.edit_q.textChanged.connect(self._render_stats)
+        self.edit_q.textChanged.connect(lambda t: self.timer_event.emit("questions", t))
         
         # 비프 사운드
         wav_path = resource_path("assets/beep.wav")   # 프로젝트루트/assets/beep.wav
@@ -116,6 +165,82 @@ class TimerWidget(QWidget):
         self._beep.setVolume(0.8)
         self._beep.setLoopCount(1) 
 
+        self.apply_theme(self._theme)
+
+    # --- 테마 ---
+    def apply_theme(self, theme: ThemeManager):
+        """글꼴/팔레트는 테마 변경 시에만 설정 (틱마다 스타일시트를 다시 파싱하지 않음)"""
+        self._theme = theme
+        self.lbl_title.setFont(theme.font("title"))
+        self.lbl_show.setFont(theme.font("display"))
+        self.lbl_show.setPalette(theme.palette("timer_warning" if self._warn else "timer"))
+        self.edit.setPalette(theme.palette("input_error") if self._edit_error else QPalette())
+
+    # --- 세션 기록/재생 ---
+    def snapshot(self) -> dict:
+        return {
+            "remaining": self._remaining,
+            "running": self._running,
+            "total": self._total,
+            "input": self.edit.text(),
+            "questions": self.edit_q.text(),
+            "elapsed_ms": self._elapsed_ms(),
+            "lap_ms": self._lap_ms,
+            "session": self._session,
+            "splits": list(self.splits.splits),
+        }
+
+    def restore(self, state: dict):
+        """기록된 상태를 표시만 한다 (카운트다운은 돌리지 않음)"""
+        self.timer.stop()
+        self._clock.invalidate()
+        self._remaining = state["remaining"]
+        self._running = state["running"]
+        self._total = state["total"]
+        self._active_ms = state["elapsed_ms"]
+        self._lap_ms = state["lap_ms"]
+        self._session = state["session"]
+        self.splits.reset()
+        for sec in state["splits"]:
+            self.splits.add(sec)
+        self.edit.setText(state["input"])
+        self.edit.setEnabled(not self._running)
+        self.edit_q.setText(state["questions"])
+        self._render()
+
+    def apply_event(self, kind: str, value):
+        """timer_event 하나를 표시 상태에 반영 (재생용, 카운트다운은 돌리지 않음)"""
+        self.timer.stop()
+        self._clock.invalidate()
+        if kind == "start":
+            if value["new_block"]:
+                self._reset_splits()
+            self._remaining = value["remaining"]
+            self._total = value["total"]
+            self.edit.setText(value["input"])
+            self._running = True
+        elif kind == "pause":
+            self._remaining = value
+            self._running = False
+        elif kind == "reset":
+            self._remaining = self._total = value["remaining"]
+            self.edit.setText(value["input"])
+            self._reset_splits()
+            self._running = False
+        elif kind == "tick":
+            self._remaining = value
+            self._running = value > 0
+            # 재생 중 진행 시간은 틱 단위로 근사
+            self._active_ms = max(self._lap_ms, (self._total - value) * 1000)
+        elif kind == "lap":
+            self.splits.add(value)
+            self._lap_ms += round(value * 1000)
+            self._active_ms = max(self._active_ms, self._lap_ms)
+        elif kind == "questions":
+            self.edit_q.setText(value)
+        self.edit.setEnabled(not self._running)
+        self._render()
+
     # --- 동작 로직 ---
     def start(self):
         if self._running:
@@ -123,36 +248,49 @@ class TimerWidget(QWidget):
 
         try:
             # 남은 시간이 0이면 입력값 파싱
-            if self._remaining <= 0:
-                self._remaining = _parse_mmss(self.edit.text())
+            new_block = self._remaining <= 0
+            if new_block:
+                self._remaining = self._total = _parse_mmss(self.edit.text())
+                self._reset_splits()  # 새 블록 → 이전 구간 기록 폐기
 
             # 0초면 시작 안 함
             if self._remaining <= 0:
                 return
 
         except ValueError:
-            # 형식 오류: 테두리 빨강 + 포커스/선택
-            self.edit.setStyleSheet("QLineEdit { border:1px solid #d9534f; }")
+            # 형식 오류: 배경 강조(캐시된 팔레트) + 포커스/선택
+            self._edit_error = True
+            self.edit.setPalette(self._theme.palette("input_error"))
             self.edit.setToolTip("시간 형식은 MM:SS 또는 초(정수)입니다.")
             self.edit.setFocus()
             self.edit.selectAll()
             return
         else:
-            # 정상: 테두리 원복
-            self.edit.setStyleSheet("")
+            # 정상: 팔레트 원복 (부모 팔레트 상속)
+            self._edit_error = False
+            self.edit.setPalette(QPalette())
             self.edit.setToolTip("")
 
         # 타이머 시작
+        if not self._session:
+            self._session = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
         self._running = True
         self.edit.setEnabled(False)
+        self._clock.start()
         self.timer.start()
         self._render()
+        self.timer_event.emit("start", {
+            "remaining": self._remaining, "total": self._total,
+            "input": self.edit.text(), "new_block": new_block,
+        })
 
     def pause(self):
         if self._running:
             self._running = False
+            self._active_ms += self._clock.elapsed()
             self.timer.stop()
             self.edit.setEnabled(True)
+            self.timer_event.emit("pause", self._remaining)
 
     def reset(self):
         self.timer.stop()
@@ -161,8 +299,52 @@ class TimerWidget(QWidget):
             self._remaining = _parse_mmss(self.edit.text())
         except Exception:
             self._remaining = 0
+        self._total = self._remaining
+        self._reset_splits()
         self.edit.setEnabled(True)
         self._render()
+        self.timer_event.emit("reset", {"remaining": self._remaining, "input": self.edit.text()})
+
+    # --- 구간 기록 ---
+    def _reset_splits(self):
+        self._active_ms = self._lap_ms = 0
+        self._session = ""
+        self.splits.reset()
+
+    def _elapsed_ms(self) -> int:
+        if self._running and self._clock.isValid():  # 재생 중에는 시계가 무효화돼 있음
+            return self._active_ms + self._clock.elapsed()
+        return self._active_ms
+
+    def lap(self):
+        """문항 경계 기록 (진행 중일 때만)"""
+        if not self._running:
+            return
+        now = self._elapsed_ms()
+        sec = (now - self._lap_ms) / 1000
+        self.splits.add(sec)
+        self._lap_ms = now
+        self._render_stats()
+        self.timer_event.emit("lap", sec)
+
+    def export_splits(self):
+        """구간 기록을 CSV에 저장 (여러 세션을 한 파일에 누적, 같은 세션은 덮어씀)"""
+        if not self.splits.count:
+            return
+        candidate, ok = QInputDialog.getText(self, "구간 기록 내보내기", "응시자/라벨:", text=self._candidate)
+        if not ok:
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "구간 기록 내보내기", "splits.csv", "CSV (*.csv)",
+            options=QFileDialog.DontConfirmOverwrite,
+        )
+        if not path:
+            return
+        self._candidate = candidate.strip()
+        try:
+            self.splits.export_csv(path, self._session, self._candidate)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "구간 기록 내보내기", str(e))
 
     def _tick(self):
         self._remaining -= 1
@@ -170,16 +352,46 @@ class TimerWidget(QWidget):
             self._remaining = 0
             self.timer.stop()
             self._running = False
+            self._active_ms += self._clock.elapsed()
             self.edit.setEnabled(True)
             self._beep.play()
         self._render()
+        self.timer_event.emit("tick", self._remaining)
 
     def _render(self):
         self.lbl_show.setText(_fmt(self._remaining))
-        color = "#222"
-        if self._running:
-            color = "#d9534f" if self._remaining <= 10 else "#222"
-        self.lbl_show.setStyleSheet(f"font-size:18px; font-weight:600; color:{color};")
+        warn = self._running and self._remaining <= 10
+        if warn != self._warn:
+            # 상태가 바뀔 때만 캐시된 팔레트로 교체
+            self._warn = warn
+            self.lbl_show.setPalette(self._theme.palette("timer_warning" if warn else "timer"))
+        self._render_stats()
+
+    def _questions(self) -> int:
+        # QIntValidator는 "+" 같은 작성 중 입력도 허용하므로 숫자가 아니면 0
+        t = self.edit_q.text().strip()
+        return int(t) if t.lstrip("+").isdecimal() else 0
+
+    def _render_stats(self):
+        st = self.splits
+        if not st.count:
+            self.lbl_stats.setText("")
+            return
+        st.questions = self._questions()
+        st.budget = self._total
+        elapsed = self._elapsed_ms() / 1000
+        parts = [
+            f"{st.count}/{st.questions}" if st.questions else f"{st.count}",
+            f"평균 {_fmt(round(st.mean()))}",
+            f"중앙 {_fmt(round(st.median()))}",
+        ]
+        proj = st.projected_finish(elapsed)
+        if proj is not None:
+            parts.append(f"예상 {_fmt(round(proj))}")
+        behind = st.behind_pace(elapsed)
+        if behind:
+            parts.append(f"-{behind}문항")
+        self.lbl_stats.setText(" · ".join(parts))
 
     def keyPressEvent(self, e):
         if e.key() == Qt.Key_Space:
@@ -193,4 +405,11 @@ class TimerWidget(QWidget):
             self.reset()
             e.accept()
             return
+        if e.key() == Qt.Key_L or (
+            e.key() in (Qt.Key_Return, Qt.Key_Enter)
+            and self.focusWidget() not in (self.edit, self.edit_q)  # 입력 확정용 Enter는 무시
+        ):
+            self.lap()
+            e.accept()
+            return
         super().keyPressEvent(e)
\ No newline at end of file
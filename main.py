@@ -1,13 +1,30 @@
 # main.py
 from PyQt5.QtWidgets import QApplication
 from gui.gui import MainWindow
+from gui.replay import SessionRecorder, ReplayWindow
+from gui.session_log import SessionLog
+import argparse
 import sys
 
 def main():
-    app = QApplication(sys.argv)
-    w = MainWindow()
+    parser = argparse.ArgumentParser(description="Aptitude Tools")
+    parser.add_argument("--record", metavar="PATH", help="세션을 기록해 종료 시 PATH에 저장")
+    parser.add_argument("--replay", metavar="PATH", help="기록된 세션 재생")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setStyle("Fusion")  # 네이티브 스타일은 팔레트 색을 무시하는 경우가 있어 Fusion 고정
+
+    if args.replay:
+        w = ReplayWindow(SessionLog.load(args.replay))
+    else:
+        w = MainWindow()
+        if args.record:
+            recorder = SessionRecorder(w, app)
+            recorder.start()
+            app.aboutToQuit.connect(lambda: recorder.save(args.record))
     w.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()